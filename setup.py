@@ -24,6 +24,9 @@ setup(
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
@@ -5,7 +5,6 @@ for easy maintenance and extension.
 """
 
 from pathlib import Path
-from decimal import Decimal
 
 
 class Config:
@@ -20,9 +19,20 @@ class Config:
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
     # Validation settings
-    WEIGHT_TOLERANCE_KG = Decimal('1.0')  # Tolerance for weight calculations
-    MAX_REASONABLE_WEIGHT_KG = Decimal('100000')  # 100 tons
-    MIN_REASONABLE_WEIGHT_KG = Decimal('1')  # 1 kg
+    # Weights are whole kilograms (int) throughout the pipeline
+    WEIGHT_TOLERANCE_KG = 1  # Tolerance for weight calculations
+    MAX_REASONABLE_WEIGHT_KG = 100000  # 100 tons
+    MIN_REASONABLE_WEIGHT_KG = 1  # 1 kg
+
+    # Extraction settings
+    EXTRACTION_CACHE_SIZE = 1024  # Cleaned texts whose extraction results are memoized
+    EXTRACTION_CACHE_MAX_CHARS = 100_000  # Longer texts bypass the cache
+    PATTERN_OVERRIDE_CACHE_SIZE = 64  # Distinct compiled per-vendor pattern lists
+
+    # Batch settings
+    # Starting a process pool costs about as much as parsing a few hundred
+    # files serially, so default-sized smaller batches stay in-process
+    PARALLEL_MIN_FILES = 256
 
     # Output settings
     OUTPUT_DIR = Path("output")
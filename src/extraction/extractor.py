@@ -5,10 +5,16 @@ from preprocessed OCR text using regex patterns defined in patterns.py.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
-import re
 
-from .patterns import COMPILED_PATTERNS
+from ..config import Config
+from .patterns import (
+    FieldPattern,
+    WEIGHT_ANY,
+    build_pattern_set,
+    find_anchored_fields,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +27,37 @@ class FieldExtractor:
     weights, dates, vehicle numbers, etc. from weighbridge receipts.
     """
 
-    def __init__(self):
-        """Initialize the field extractor."""
-        self.patterns = COMPILED_PATTERNS
-        self.logger = logging.getLogger(self.__class__.__name__)
+    logger = logging.getLogger(__qualname__)
+
+    def __init__(self, patterns: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the field extractor.
+
+        Args:
+            patterns: Optional per-field alternatives (keyed like PatternSet)
+                replacing the default patterns for those fields
+        """
+        self.patterns = patterns
+        self.p = build_pattern_set(patterns)
+        # Overridden fields have no known anchor literals or labels
+        self._custom = frozenset(patterns or ())
+        self._weight_patterns = {
+            'gross': self.p.weight_gross,
+            'tare': self.p.weight_tare,
+            'net': self.p.weight_net,
+        }
+        # Reprocessed documents (retries, dev loops) skip the regex pass
+        self._extract_cached = lru_cache(maxsize=Config.EXTRACTION_CACHE_SIZE)(
+            self._extract_fields
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only the configuration (e.g. for batch worker processes)."""
+        return {'patterns': self.patterns}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Rebuild the compiled patterns and an empty result cache."""
+        FieldExtractor.__init__(self, state['patterns'])
 
     def extract(self, text: str) -> Dict[str, Any]:
         """
@@ -38,63 +71,86 @@ class FieldExtractor:
         """
         self.logger.debug("Starting field extraction")
 
-        extracted = {
-            'date': self._extract_date(text),
-            'time': self._extract_time(text),
-            'vehicle_number': self._extract_vehicle_number(text),
-            'gross_weight': self._extract_weight(text, 'gross'),
-            'tare_weight': self._extract_weight(text, 'tare'),
-            'net_weight': self._extract_weight(text, 'net'),
-            'customer_name': self._extract_customer(text),
-            'product_name': self._extract_product(text),
-            'transaction_type': self._extract_transaction_type(text),
-            'measurement_id': self._extract_measurement_id(text),
-            'location': self._extract_location(text),
-            'raw_text': text,
-        }
+        if len(text) > Config.EXTRACTION_CACHE_MAX_CHARS:
+            extracted = self._extract_fields(text)
+        else:
+            # Copy so callers can never mutate the cached result
+            extracted = dict(self._extract_cached(text))
 
-        # Log extraction results
-        non_null_fields = {k: v for k, v in extracted.items() if v is not None and k != 'raw_text'}
-        self.logger.info(f"Extracted {len(non_null_fields)} fields: {list(non_null_fields.keys())}")
+        # Log extraction results (only build the field list if it will be logged)
+        if self.logger.isEnabledFor(logging.INFO):
+            non_null_fields = [k for k, v in extracted.items() if v is not None and k != 'raw_text']
+            self.logger.info("Extracted %d fields: %s", len(non_null_fields), non_null_fields)
 
         return extracted
 
-    def _extract_with_patterns(self, text: str, pattern_key: str) -> Optional[str]:
+    def _extract_fields(self, text: str) -> Dict[str, Any]:
+        """
+        Run every field pattern over the text.
+
+        Args:
+            text: Cleaned OCR text
+
+        Returns:
+            Dictionary of extracted fields with raw values
+        """
+        # Skip fields whose anchor literals do not occur in the text at all
+        present = find_anchored_fields(text)
+        if self._custom:
+            present |= self._custom
+
+        return {
+            'date': self._extract_date(text) if 'date' in present else None,
+            'time': self._extract_time(text) if 'time' in present else None,
+            'vehicle_number': self._extract_vehicle_number(text)
+            if 'vehicle' in present else None,
+            'gross_weight': self._extract_weight(text, 'gross')
+            if 'weight_gross' in present else None,
+            'tare_weight': self._extract_weight(text, 'tare')
+            if 'weight_tare' in present else None,
+            'net_weight': self._extract_weight(text, 'net')
+            if 'weight_net' in present else None,
+            'customer_name': self._extract_customer(text) if 'customer' in present else None,
+            'product_name': self._extract_product(text) if 'product' in present else None,
+            'transaction_type': self._extract_transaction_type(text)
+            if 'transaction_type' in present else None,
+            'measurement_id': self._extract_measurement_id(text)
+            if 'measurement_id' in present else None,
+            'location': self._extract_location(text) if 'location' in present else None,
+            'raw_text': text,
+        }
+
+    def _first_match(self, pattern: FieldPattern, text: str) -> Optional[str]:
         """
         Generic pattern-based extraction.
 
         Args:
+            pattern: Compiled field pattern to search with
             text: Text to search
-            pattern_key: Key in COMPILED_PATTERNS dict
 
         Returns:
-            First match found, or None
+            Match of the highest-priority pattern, or None
         """
-        if pattern_key not in self.patterns:
-            self.logger.warning(f"Pattern key '{pattern_key}' not found")
-            return None
-
-        for pattern in self.patterns[pattern_key]:
-            match = pattern.search(text)
-            if match:
-                value = match.group(1).strip()
-                self.logger.debug(f"Extracted {pattern_key}: {value}")
-                return value
+        groups = pattern.search(text)
+        if groups and groups[0] is not None:
+            value = groups[0].strip()
+            self.logger.debug("Extracted %s: %s", pattern.key, value)
+            return value
 
-        self.logger.debug(f"No match found for {pattern_key}")
+        self.logger.debug("No match found for %s", pattern.key)
         return None
 
     def _extract_date(self, text: str) -> Optional[str]:
         """Extract measurement date."""
-        return self._extract_with_patterns(text, 'date')
+        return self._first_match(self.p.date, text)
 
     def _extract_time(self, text: str) -> Optional[str]:
         """Extract measurement time."""
-        return self._extract_with_patterns(text, 'time')
+        return self._first_match(self.p.time, text)
 
     def _extract_vehicle_number(self, text: str) -> Optional[str]:
         """Extract vehicle number."""
-        return self._extract_with_patterns(text, 'vehicle')
+        return self._first_match(self.p.vehicle, text)
 
     def _extract_weight(self, text: str, weight_type: str) -> Optional[str]:
         """
@@ -107,48 +163,42 @@ class FieldExtractor:
         Returns:
             Weight value as string (with commas/spaces preserved)
         """
-        pattern_key = f'weight_{weight_type}'
-
-        if pattern_key not in self.patterns:
-            self.logger.warning(f"Pattern key '{pattern_key}' not found")
+        pattern = self._weight_patterns.get(weight_type)
+        if pattern is None:
+            self.logger.warning("Unknown weight type '%s'", weight_type)
             return None
 
-        for pattern in self.patterns[pattern_key]:
-            match = pattern.search(text)
-            if match:
-                # Handle patterns with multiple capture groups
-                if len(match.groups()) > 1:
-                    # Combine all captured groups
-                    value = ''.join(g for g in match.groups() if g)
-                else:
-                    value = match.group(1)
-
-                value = value.strip()
-                self.logger.debug(f"Extracted {pattern_key}: {value}")
-                return value
-
-        self.logger.debug(f"No match found for {pattern_key}")
+        groups = pattern.search(text)
+        if groups:
+            # Combine all captured groups (some patterns split the number)
+            value = ''.join(g for g in groups if g)
+
+            value = value.strip()
+            self.logger.debug("Extracted %s: %s", pattern.key, value)
+            return value
+
+        self.logger.debug("No match found for %s", pattern.key)
         return None
 
     def _extract_customer(self, text: str) -> Optional[str]:
         """Extract customer/company name."""
-        return self._extract_with_patterns(text, 'customer')
+        return self._first_match(self.p.customer, text)
 
     def _extract_product(self, text: str) -> Optional[str]:
         """Extract product name."""
-        return self._extract_with_patterns(text, 'product')
+        return self._first_match(self.p.product, text)
 
     def _extract_transaction_type(self, text: str) -> Optional[str]:
         """Extract transaction type (입고/출고)."""
-        return self._extract_with_patterns(text, 'transaction_type')
+        return self._first_match(self.p.transaction_type, text)
 
     def _extract_measurement_id(self, text: str) -> Optional[str]:
         """Extract measurement ID or count."""
-        return self._extract_with_patterns(text, 'measurement_id')
+        return self._first_match(self.p.measurement_id, text)
 
     def _extract_location(self, text: str) -> Optional[str]:
         """Extract weighbridge location/company."""
-        return self._extract_with_patterns(text, 'location')
+        return self._first_match(self.p.location, text)
 
     def extract_all_weights(self, text: str) -> List[str]:
         """
@@ -160,11 +210,4 @@ class FieldExtractor:
         Returns:
             List of all weight strings found
         """
-        weights = []
-        # Pattern to find any number followed by kg
-        weight_pattern = re.compile(r'(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg', re.IGNORECASE)
-
-        for match in weight_pattern.finditer(text):
-            weights.append(match.group(1))
-
-        return weights
+        return [match.group(1) for match in WEIGHT_ANY.finditer(text)]
@@ -6,7 +6,11 @@ and noise in OCR output.
 """
 
 import re
-from typing import Dict, List
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..config import Config
 
 # Date patterns - handle various date formats
 DATE_PATTERNS = [
@@ -34,31 +38,37 @@ VEHICLE_NUMBER_PATTERNS = [
 ]
 
 # Weight patterns - handle weights with units and various formats
+# Labels are written once with optional whitespace (e.g. 총\s*중\s*량 also
+# covers 총중량) so the engine never tries redundant alternatives.
 WEIGHT_PATTERNS = {
     'gross': [
         # Pattern with time followed by weight
-        r'(?:총\s*중\s*량|총중량)[\s:：]*(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2})\s*(\d{1,2})\s+(\d{3})\s*kg',
-        r'(?:총\s*중\s*량|총중량)[\s:：]*(?:(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2})\s*)?(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
-        # Fallback pattern
-        r'(?:총\s*중\s*량|총중량)[\s:：]*(?:[^\d]*)(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
+        r'총\s*중\s*량[\s:：]*(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2}(?::\d{2})?)\s*(\d{1,2})\s+(\d{3})\s*kg',
+        r'총\s*중\s*량[\s:：]*(?:(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2}(?::\d{2})?)\s*)?(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
+        # Fallback pattern (skip any non-digit run; kept free of overlapping
+        # quantifiers so a failed match cannot backtrack quadratically)
+        r'총\s*중\s*량[^\d]*(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
         # For sample_01: timestamp followed by weight (no label)
         r'\d{2}:\d{2}:\d{2}\s+(\d{1,3}[,\s]?\d{3})\s*kg',
     ],
     'tare': [
         # Pattern with time and spaces in number (e.g., "02 : 13 7 560 kg")
-        r'(?:차\s*중\s*량|차중량|공\s*차\s*중\s*량|공차중량)[\s:：]*(?:\d{1,2}\s*:\s*\d{2})\s*(\d{1,2})\s+(\d{3})\s*kg',
-        r'(?:차\s*중\s*량|차중량|공\s*차\s*중\s*량|공차중량)[\s:：]*(?:(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2})\s*)?(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
-        r'(?:차\s*중\s*량|차중량|공\s*차\s*중\s*량|공차중량)[\s:：]*(?:[^\d]*)(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
+        r'(?:공\s*)?차\s*중\s*량[\s:：]*(?:\d{1,2}\s*:\s*\d{2}(?:\s*:\s*\d{2})?)\s*(\d{1,2})\s+(\d{3})\s*kg',
+        r'(?:공\s*)?차\s*중\s*량[\s:：]*(?:(?:\d{1,2}시\s*\d{1,2}분|\d{1,2}:\d{2}(?::\d{2})?)\s*)?(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
+        r'(?:공\s*)?차\s*중\s*량[^\d]*(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
         # Bare "중량:" pattern for sample_01
         r'중\s*량[\s:：]*\d{2}:\d{2}:\d{2}\s+(\d{1,3}[,\s]?\d{3})\s*kg',
     ],
     'net': [
-        r'(?:실\s*중\s*량|실중량)[\s:：]*(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
+        r'실\s*중\s*량[\s:：]*(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg',
         # Handle spaces in numbers like "5 900"
-        r'(?:실\s*중\s*량|실중량)[\s:：]*(\d{1,2})\s+(\d{3})\s*kg',
+        r'실\s*중\s*량[\s:：]*(\d{1,2})\s+(\d{3})\s*kg',
     ],
 }
 
+# Any number followed by kg (used to list every weight on a receipt)
+WEIGHT_ANY = re.compile(r'(\d{1,3}[,\s]?\d{3}|\d{1,6})\s*kg', re.IGNORECASE)
+
 # Customer/Company name patterns
 CUSTOMER_PATTERNS = [
     r'(?:거\s*래\s*처|거래처|상\s*호|상호|회\s*사\s*명|회사명)[\s:：]*([가-힣()]{2,30})',
@@ -88,45 +98,188 @@ LOCATION_PATTERNS = [
 ]
 
 
-def compile_patterns() -> Dict[str, List[re.Pattern]]:
+# Literals of which at least one must appear (case-insensitively) for any
+# of a field's patterns to match; used to skip fields that cannot match
+FIELD_ANCHORS = {
+    'date': ('-', '/', '.', '년'),
+    'time': (':', '시'),
+    'vehicle': ('번', 'no'),
+    'weight_gross': ('kg',),
+    'weight_tare': ('kg',),
+    'weight_net': ('kg',),
+    'customer': ('처', '호', '명'),
+    'product': ('명',),
+    'transaction_type': ('입고', '출고'),
+    'measurement_id': ('횟', '번', 'no'),
+    'location': ('(주)', '환경', '바이오', '리사이클링', 'c&s'),
+}
+
+# Each distinct anchor is only looked up once per text
+_ANCHOR_LITERALS = frozenset(a for anchors in FIELD_ANCHORS.values() for a in anchors)
+
+
+def find_anchored_fields(text: str) -> Set[str]:
+    """
+    Find the fields whose anchor literals occur in text.
+
+    Fields missing from the result cannot match any of their patterns,
+    so their regex search can be skipped entirely.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Set of pattern keys worth searching
+    """
+    folded = text.casefold()
+    found = {a for a in _ANCHOR_LITERALS if a in folded}
+    return {key for key, anchors in FIELD_ANCHORS.items() if not found.isdisjoint(anchors)}
+
+
+class FieldPattern:
+    """
+    All alternative patterns for one field, compiled once.
+
+    Alternatives are tried in priority order and the captures of the first
+    one that matches are returned, so callers make a single call per field
+    and never need to know how many groups a given alternative captured.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        patterns: List[str],
+        flags: int = re.IGNORECASE
+    ):
+        """
+        Compile the field's alternatives.
+
+        Args:
+            key: Field key the patterns belong to
+            patterns: Alternative regex patterns in priority order
+            flags: Regex flags applied to all alternatives
+        """
+        self.key = key
+        self.alternatives = [re.compile(p, flags) for p in patterns]
+
+    def search(self, text: str) -> Optional[Tuple[Optional[str], ...]]:
+        """
+        Find the highest-priority alternative matching anywhere in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Capture groups of the winning alternative, or None
+        """
+        # CPython's sre scans each alternative quickly using its literal
+        # prefix; a single ORed regex loses that and is measurably slower.
+        for pattern in self.alternatives:
+            match = pattern.search(text)
+            if match:
+                return match.groups()
+        return None
+
+
+def compile_patterns() -> Dict[str, FieldPattern]:
     """
     Compile all regex patterns for efficient reuse.
 
     Returns:
-        Dictionary mapping field names to compiled regex patterns
+        Dictionary mapping field names to their compiled field patterns
     """
     compiled = {}
 
     # Compile date patterns
-    compiled['date'] = [re.compile(p, re.IGNORECASE) for p in DATE_PATTERNS]
+    compiled['date'] = FieldPattern('date', DATE_PATTERNS)
 
     # Compile time patterns
-    compiled['time'] = [re.compile(p, re.IGNORECASE) for p in TIME_PATTERNS]
+    compiled['time'] = FieldPattern('time', TIME_PATTERNS)
 
     # Compile vehicle patterns
-    compiled['vehicle'] = [re.compile(p, re.IGNORECASE) for p in VEHICLE_NUMBER_PATTERNS]
+    compiled['vehicle'] = FieldPattern('vehicle', VEHICLE_NUMBER_PATTERNS)
 
     # Compile weight patterns
     for weight_type, patterns in WEIGHT_PATTERNS.items():
-        compiled[f'weight_{weight_type}'] = [re.compile(p, re.IGNORECASE) for p in patterns]
+        key = f'weight_{weight_type}'
+        compiled[key] = FieldPattern(key, patterns)
 
     # Compile customer patterns
-    compiled['customer'] = [re.compile(p, re.IGNORECASE) for p in CUSTOMER_PATTERNS]
+    compiled['customer'] = FieldPattern('customer', CUSTOMER_PATTERNS)
 
     # Compile product patterns
-    compiled['product'] = [re.compile(p, re.IGNORECASE) for p in PRODUCT_PATTERNS]
+    compiled['product'] = FieldPattern('product', PRODUCT_PATTERNS)
 
     # Compile transaction type patterns
-    compiled['transaction_type'] = [re.compile(p, re.IGNORECASE) for p in TRANSACTION_TYPE_PATTERNS]
+    compiled['transaction_type'] = FieldPattern('transaction_type', TRANSACTION_TYPE_PATTERNS)
 
     # Compile measurement ID patterns
-    compiled['measurement_id'] = [re.compile(p, re.IGNORECASE) for p in MEASUREMENT_ID_PATTERNS]
+    compiled['measurement_id'] = FieldPattern('measurement_id', MEASUREMENT_ID_PATTERNS)
 
     # Compile location patterns
-    compiled['location'] = [re.compile(p, re.IGNORECASE) for p in LOCATION_PATTERNS]
+    compiled['location'] = FieldPattern('location', LOCATION_PATTERNS)
 
     return compiled
 
 
+# Compiled patterns as a fixed struct, so the extractor reads each field's
+# pattern with one attribute access instead of string-keyed dict lookups
+PatternSet = namedtuple('PatternSet', [
+    'date', 'time', 'vehicle',
+    'weight_gross', 'weight_tare', 'weight_net',
+    'customer', 'product', 'transaction_type', 'measurement_id', 'location',
+])
+
+
 # Precompile patterns for performance
 COMPILED_PATTERNS = compile_patterns()
+COMPILED = PatternSet(**COMPILED_PATTERNS)
+
+
+@lru_cache(maxsize=Config.PATTERN_OVERRIDE_CACHE_SIZE)
+def _compile_override(key: str, patterns: Tuple[str, ...]) -> FieldPattern:
+    """Compile one overridden field, once per distinct pattern list."""
+    return FieldPattern(key, list(patterns))
+
+
+def build_pattern_set(
+    overrides: Optional[Dict[str, List[str]]] = None
+) -> PatternSet:
+    """
+    Build a pattern set with some fields' alternatives replaced.
+
+    Vendors whose receipts use other labels can swap in their own
+    alternatives for just those fields; every other field keeps the
+    shared default patterns. Overrides are compiled once per distinct
+    pattern list and shared by every extractor that uses them.
+
+    Args:
+        overrides: Mapping of PatternSet field to alternatives in priority order
+
+    Returns:
+        PatternSet to extract with
+
+    Raises:
+        ValueError: If overrides is not a mapping, names an unknown field,
+            or gives a field anything but a non-empty list of strings
+    """
+    if overrides is None:
+        return COMPILED
+    if not isinstance(overrides, dict):
+        raise ValueError("Pattern overrides must map field names to lists of patterns")
+    if not overrides:
+        return COMPILED
+
+    unknown = set(overrides).difference(PatternSet._fields)
+    if unknown:
+        raise ValueError(f"Unknown pattern fields: {', '.join(sorted(unknown))}")
+
+    for key, patterns in overrides.items():
+        if (not isinstance(patterns, list) or not patterns
+                or not all(isinstance(p, str) for p in patterns)):
+            raise ValueError(f"Patterns for '{key}' must be a non-empty list of strings")
+
+    return COMPILED._replace(**{
+        key: _compile_override(key, tuple(patterns))
+        for key, patterns in overrides.items()
+    })
@@ -8,10 +8,15 @@ validated structured output.
 """
 
 import argparse
+import json
+import os
+import re
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
 
 from .config import Config
@@ -19,7 +24,7 @@ from .utils.logger import setup_logger
 from .utils.io_handler import IOHandler
 from .preprocessing.cleaner import TextCleaner
 from .extraction.extractor import FieldExtractor
-from .normalization.normalizer import DataNormalizer
+from .normalization.normalizer import DataNormalizer, intern_categorical
 from .validation.validator import DataValidator
 from .models.schema import WeighbridgeRecord
 
@@ -36,47 +41,90 @@ class OCRParser:
     5. Output generation
     """
 
-    def __init__(self, log_level: str = "INFO"):
+    def __init__(
+        self,
+        log_level: str = "INFO",
+        patterns: Optional[Dict[str, List[str]]] = None
+    ):
         """
         Initialize the parser with all components.
 
         Args:
             log_level: Logging level
+            patterns: Optional per-vendor field patterns for the extractor
+                (see FieldExtractor)
         """
-        # Set up logging
-        self.logger = setup_logger(
-            name="ocr_parser",
-            level=getattr(logging, log_level.upper(), logging.INFO)
-        )
+        self._setup_logging(log_level)
 
         # Initialize pipeline components
         self.io_handler = IOHandler()
         self.cleaner = TextCleaner()
-        self.extractor = FieldExtractor()
+        self.extractor = FieldExtractor(patterns)
         self.normalizer = DataNormalizer()
         self.validator = DataValidator(tolerance_kg=Config.WEIGHT_TOLERANCE_KG)
 
         self.logger.info(f"Initialized {Config.APP_NAME} v{Config.VERSION}")
 
-    def parse_file(self, input_path: Path) -> Dict[str, Any]:
+    @classmethod
+    def _from_components(cls, log_level: str, components: Dict[str, Any]) -> 'OCRParser':
+        """
+        Build a parser around existing pipeline components.
+
+        Used by batch worker processes, which get the parent parser's
+        components instead of constructing the defaults.
+
+        Args:
+            log_level: Logging level
+            components: Pipeline component for each of _PIPELINE_COMPONENTS
+
+        Returns:
+            Parser using the given components
+        """
+        parser = cls.__new__(cls)
+        parser._setup_logging(log_level)
+        for name in _PIPELINE_COMPONENTS:
+            setattr(parser, name, components[name])
+        return parser
+
+    def _setup_logging(self, log_level: str):
+        """Set up the parser's logger at log_level."""
+        self.log_level = log_level
+        self.logger = setup_logger(
+            name="ocr_parser",
+            level=getattr(logging, log_level.upper(), logging.INFO)
+        )
+
+    def parse_file(
+        self,
+        input_path: Path,
+        processed_at: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Parse a single OCR file.
 
         Args:
             input_path: Path to input OCR JSON file
+            processed_at: Processing time to record and validate dates
+                against (default: now); batches pass one shared timestamp
+                instead of reading the clock per file
 
         Returns:
             Parsed and validated record dictionary
         """
         self.logger.info(f"Processing file: {input_path}")
 
+        if processed_at is None:
+            processed_at = datetime.now()
+        timestamp = processed_at.isoformat()
+
         try:
             # Step 1: Load OCR data
             ocr_data = self.io_handler.read_ocr_json(input_path)
 
             # Step 2: Clean text
             cleaned_text = self.cleaner.clean(ocr_data)
-            self.logger.debug(f"Cleaned text preview: {cleaned_text[:200]}...")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Cleaned text preview: %s...", cleaned_text[:200])
 
             # Step 3: Extract fields
             extracted_data = self.extractor.extract(cleaned_text)
@@ -85,7 +133,7 @@ class OCRParser:
             normalized_data = self.normalizer.normalize(extracted_data)
 
             # Step 5: Validate data
-            validation_result = self.validator.validate(normalized_data)
+            validation_result = self.validator.validate(normalized_data, now=processed_at)
 
             # Step 6: Create structured record
             try:
@@ -98,14 +146,13 @@ class OCRParser:
             # Add metadata
             result = {
                 'file_name': input_path.name,
-                'processed_at': datetime.now().isoformat(),
+                'processed_at': timestamp,
                 'validation': {
                     'is_valid': validation_result.is_valid,
                     'warnings': validation_result.warnings,
                     'errors': validation_result.errors,
                     'weight_consistency': validation_result.weight_consistency,
-                    'computed_net_weight_kg': float(validation_result.computed_net_weight)
-                    if validation_result.computed_net_weight else None,
+                    'computed_net_weight_kg': validation_result.computed_net_weight or None,
                 },
                 'data': record_dict
             }
@@ -124,7 +171,7 @@ class OCRParser:
             self.logger.error(f"Failed to process {input_path}: {e}", exc_info=True)
             return {
                 'file_name': input_path.name,
-                'processed_at': datetime.now().isoformat(),
+                'processed_at': timestamp,
                 'error': str(e),
                 'validation': {
                     'is_valid': False,
@@ -132,50 +179,118 @@ class OCRParser:
                 }
             }
 
-    def parse_batch(self, input_paths: List[Path]) -> List[Dict[str, Any]]:
+    def parse_batch(
+        self,
+        input_paths: List[Path],
+        workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Parse multiple OCR files.
 
         Args:
             input_paths: List of input file paths
+            workers: Number of worker processes (default: CPU count for
+                batches of at least Config.PARALLEL_MIN_FILES files,
+                otherwise serial; 1 processes files serially in this process)
 
         Returns:
             List of parsed records
         """
-        self.logger.info(f"Starting batch processing of {len(input_paths)} files")
+        return list(self.parse_batch_iter(input_paths, workers))
 
-        results = []
-        success_count = 0
-        error_count = 0
+    def parse_batch_iter(
+        self,
+        input_paths: List[Path],
+        workers: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse multiple OCR files, yielding each result as it is ready.
+
+        Files are independent, so large batches are spread over a process
+        pool. Without an explicit workers count, batches smaller than
+        Config.PARALLEL_MIN_FILES are parsed serially, since starting the
+        pool would cost more than it saves. Results keep the order of
+        input_paths.
 
-        for path in input_paths:
-            result = self.parse_file(path)
-            results.append(result)
+        Args:
+            input_paths: List of input file paths
+            workers: Number of worker processes (default: CPU count for
+                batches of at least Config.PARALLEL_MIN_FILES files,
+                otherwise serial; 1 processes files serially in this process)
+
+        Yields:
+            Parsed records
+        """
+        self.logger.info(f"Starting batch processing of {len(input_paths)} files")
 
-            if result.get('validation', {}).get('is_valid', False):
-                success_count += 1
+        # One timestamp for the whole batch
+        processed_at = datetime.now()
+
+        if workers is None:
+            if len(input_paths) < Config.PARALLEL_MIN_FILES:
+                workers = 1
             else:
-                error_count += 1
+                workers = os.cpu_count() or 1
+        workers = min(workers, len(input_paths))
+
+        success_count = 0
+        total = 0
+        results: Iterator[Dict[str, Any]]
+
+        if workers <= 1:
+            results = (self.parse_file(path, processed_at) for path in input_paths)
+            for result in results:
+                success_count += result.get('validation', {}).get('is_valid', False)
+                total += 1
+                yield result
+        else:
+            # Several files per task amortize the inter-process overhead
+            chunksize = max(1, len(input_paths) // (4 * workers))
+            # Workers get this parser's components, so customized ones
+            # (e.g. a vendor extractor) give the same results as a serial run
+            components = {name: getattr(self, name) for name in _PIPELINE_COMPONENTS}
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.log_level, components)
+            ) as executor:
+                results = executor.map(
+                    _parse_in_worker,
+                    input_paths,
+                    repeat(processed_at),
+                    chunksize=chunksize
+                )
+                for result in results:
+                    # Unpickled results carry their own string copies
+                    data = result.get('data')
+                    if data:
+                        intern_categorical(data)
+                    success_count += result.get('validation', {}).get('is_valid', False)
+                    total += 1
+                    yield result
+
+        error_count = total - success_count
 
         self.logger.info(
             f"Batch processing complete: {success_count} successful, "
             f"{error_count} with errors/warnings"
         )
 
-        return results
-
     def save_results(
         self,
-        results: List[Dict[str, Any]],
+        results: Iterable[Dict[str, Any]],
         output_format: str = "json",
         output_path: Path = None
     ):
         """
         Save parsing results to file.
 
+        Output is written record by record, so results can be a
+        generator such as parse_batch_iter().
+
         Args:
-            results: List of parsed records
-            output_format: Output format ('json' or 'csv')
+            results: Parsed records (list or iterator)
+            output_format: Output format ('json', 'ndjson' or 'csv')
             output_path: Optional custom output path
         """
         if output_path is None:
@@ -185,24 +300,59 @@ class OCRParser:
 
         # Flatten results for CSV (extract data fields)
         if output_format == "csv":
-            flattened = []
-            for result in results:
-                flat_record = {
-                    'file_name': result['file_name'],
-                    'processed_at': result['processed_at'],
-                    'is_valid': result.get('validation', {}).get('is_valid', False),
-                    **result.get('data', {})
-                }
-                # Remove raw_text for CSV to keep it manageable
-                flat_record.pop('raw_text', None)
-                flattened.append(flat_record)
-            self.io_handler.write_csv(flattened, output_path)
+            self.io_handler.write_csv(
+                (_flatten_for_csv(result) for result in results),
+                output_path,
+                fieldnames=list(_CSV_FIELDS)
+            )
+        elif output_format == "ndjson":
+            self.io_handler.write_ndjson(results, output_path)
         else:
             self.io_handler.write_json(results, output_path)
 
         self.logger.info(f"Results saved to {output_path}")
 
 
+# CSV columns: fixed up front so rows streamed after an error record
+# (which has no data fields) still keep every record field
+_CSV_FIELDS = ('file_name', 'processed_at', 'is_valid') + tuple(
+    name for name in WeighbridgeRecord.model_fields if name != 'raw_text'
+)
+
+
+def _flatten_for_csv(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one parse result into a CSV row (data fields inline)."""
+    flat_record = {
+        'file_name': result['file_name'],
+        'processed_at': result['processed_at'],
+        'is_valid': result.get('validation', {}).get('is_valid', False),
+        **result.get('data', {})
+    }
+    # Remove raw_text for CSV to keep it manageable
+    flat_record.pop('raw_text', None)
+    return flat_record
+
+
+# OCRParser attributes handed to each batch worker process
+_PIPELINE_COMPONENTS = ('io_handler', 'cleaner', 'extractor', 'normalizer', 'validator')
+
+# Parser owned by each worker process during parallel batch processing
+_worker_parser: Optional[OCRParser] = None
+
+
+def _init_worker(log_level: str, components: Dict[str, Any]):
+    """Create the worker process's parser (ProcessPoolExecutor initializer)."""
+    global _worker_parser
+    _worker_parser = OCRParser._from_components(log_level, components)
+
+
+def _parse_in_worker(input_path: Path, processed_at: datetime) -> Dict[str, Any]:
+    """Parse one file with the worker process's parser."""
+    if _worker_parser is None:
+        raise RuntimeError("Worker process was not initialized")
+    return _worker_parser.parse_file(input_path, processed_at)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -216,8 +366,17 @@ Examples:
   # Parse multiple files
   python -m src.main -i data/*.json -f csv
 
+  # Write one JSON record per line
+  python -m src.main -i data/*.json -f ndjson
+
   # Enable debug logging
   python -m src.main -i data/*.json --log-level DEBUG
+
+  # Parse a batch with 4 worker processes
+  python -m src.main -i data/*.json -w 4
+
+  # Use a vendor's own field patterns (JSON: field key -> list of regexes)
+  python -m src.main -i data/*.json --patterns vendor_patterns.json
         """
     )
 
@@ -237,7 +396,7 @@ Examples:
 
     parser.add_argument(
         '-f', '--format',
-        choices=['json', 'csv'],
+        choices=['json', 'ndjson', 'csv'],
         default='json',
         help='Output format (default: json)'
     )
@@ -249,10 +408,35 @@ Examples:
         help='Logging level (default: INFO)'
     )
 
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        help='Number of worker processes for batch parsing (default: CPU count '
+             f'for batches of {Config.PARALLEL_MIN_FILES}+ files, otherwise serial)'
+    )
+
+    parser.add_argument(
+        '--patterns',
+        type=str,
+        help='JSON file mapping field keys to regex alternatives that replace '
+             'the default patterns for those fields'
+    )
+
     args = parser.parse_args()
 
+    patterns = None
+    if args.patterns:
+        try:
+            with open(args.patterns, encoding='utf-8') as f:
+                patterns = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not read patterns file {args.patterns}: {e}")
+
     # Initialize parser
-    ocr_parser = OCRParser(log_level=args.log_level)
+    try:
+        ocr_parser = OCRParser(log_level=args.log_level, patterns=patterns)
+    except (ValueError, re.error) as e:
+        parser.error(f"Invalid patterns: {e}")
 
     # Resolve input paths
     input_paths = []
@@ -274,18 +458,23 @@ Examples:
         ocr_parser.logger.error("No valid input files found")
         sys.exit(1)
 
-    # Parse files
-    results = ocr_parser.parse_batch(input_paths)
+    # Parse files, streaming each result to the output as it finishes
+    results = ocr_parser.parse_batch_iter(input_paths, workers=args.workers)
+
+    error_count = 0
+
+    def count_errors(records):
+        nonlocal error_count
+        for record in records:
+            if not record.get('validation', {}).get('is_valid', False):
+                error_count += 1
+            yield record
 
     # Save results
     output_path = Path(args.output) if args.output else None
-    ocr_parser.save_results(results, args.format, output_path)
+    ocr_parser.save_results(count_errors(results), args.format, output_path)
 
     # Exit with appropriate code
-    error_count = sum(
-        1 for r in results
-        if not r.get('validation', {}).get('is_valid', False)
-    )
 
     if error_count > 0:
         ocr_parser.logger.warning(f"{error_count} file(s) had validation errors/warnings")
@@ -6,8 +6,13 @@ ensuring type safety and validation throughout the parsing pipeline.
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, model_validator
-from decimal import Decimal
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
 
 
 class WeighbridgeRecord(BaseModel):
@@ -15,9 +20,9 @@ class WeighbridgeRecord(BaseModel):
     Structured representation of a weighbridge receipt.
 
     Attributes:
-        gross_weight_kg: Total weight including vehicle (in kg)
-        tare_weight_kg: Vehicle weight without load (in kg)
-        net_weight_kg: Actual cargo weight (in kg)
+        gross_weight_kg: Total weight including vehicle (in whole kg)
+        tare_weight_kg: Vehicle weight without load (in whole kg)
+        net_weight_kg: Actual cargo weight (in whole kg)
         vehicle_number: Vehicle registration/identification number
         measurement_date: Date of measurement
         measurement_time: Time of measurement (optional)
@@ -31,9 +36,12 @@ class WeighbridgeRecord(BaseModel):
         confidence_score: OCR confidence score (optional)
     """
 
-    gross_weight_kg: Optional[Decimal] = Field(None, description="Gross weight in kg")
-    tare_weight_kg: Optional[Decimal] = Field(None, description="Tare weight in kg")
-    net_weight_kg: Optional[Decimal] = Field(None, description="Net weight in kg")
+    # Records are immutable once built
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    gross_weight_kg: Optional[int] = Field(None, description="Gross weight in kg")
+    tare_weight_kg: Optional[int] = Field(None, description="Tare weight in kg")
+    net_weight_kg: Optional[int] = Field(None, description="Net weight in kg")
     vehicle_number: Optional[str] = Field(None, description="Vehicle identification number")
     measurement_date: Optional[datetime] = Field(None, description="Date of measurement")
     measurement_time: Optional[str] = Field(None, description="Time of measurement")
@@ -59,22 +67,14 @@ class WeighbridgeRecord(BaseModel):
         """Validate that gross = tare + net (within tolerance)."""
         if all([self.gross_weight_kg, self.tare_weight_kg, self.net_weight_kg]):
             expected_net = self.gross_weight_kg - self.tare_weight_kg
-            tolerance = Decimal('0.5')  # Allow 0.5 kg tolerance for rounding
 
-            if abs(expected_net - self.net_weight_kg) > tolerance:
+            # Weights are whole kg, so a 0.5 kg rounding tolerance means exact
+            if expected_net != self.net_weight_kg:
                 # Store warning but don't fail validation
                 # This allows us to capture the inconsistency
                 pass
         return self
 
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            Decimal: float,
-            datetime: lambda v: v.isoformat() if v else None
-        }
-        validate_assignment = True
-
 
 class ValidationResult(BaseModel):
     """
@@ -88,14 +88,10 @@ class ValidationResult(BaseModel):
         weight_consistency: Whether weights are mathematically consistent
     """
 
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     is_valid: bool = Field(..., description="Overall validation status")
     warnings: List[str] = Field(default_factory=list, description="Non-critical issues")
     errors: List[str] = Field(default_factory=list, description="Critical validation errors")
-    computed_net_weight: Optional[Decimal] = Field(None, description="Calculated net weight")
+    computed_net_weight: Optional[int] = Field(None, description="Calculated net weight in kg")
     weight_consistency: bool = Field(True, description="Weight math consistency")
-
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            Decimal: float
-        }
@@ -7,25 +7,111 @@ formats suitable for the data model.
 import re
 import logging
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from sys import intern
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of going through the re cache
+_KOREAN_DATE = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+_DATE_TAIL = re.compile(r'-\d{5,6}$')
+# YYYY-MM-DD with one consistent separator (-, / or .)
+_DATE_RE = re.compile(r'(\d{4})([-/.])(\d{1,2})\2(\d{1,2})')
+_KOREAN_TIME = re.compile(r'(\d{1,2})시\s*(\d{1,2})분')
+_TIME_PAT = re.compile(r'(\d{1,2}):(\d{2})(?::(\d{2}))?')
+
+
+# Normalized fields whose values repeat across receipts
+CATEGORICAL_FIELDS = (
+    'vehicle_number', 'customer_name', 'product_name', 'transaction_type', 'location'
+)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one string object per distinct categorical value."""
+    return intern(value) if value is not None else None
+
+
+def intern_categorical(record: Dict[str, Any]):
+    """
+    Re-intern a record's categorical values in place.
+
+    Interning only holds within one process: records pickled back from
+    batch worker processes arrive with fresh string copies.
+
+    Args:
+        record: Normalized record (or its model_dump) to update
+    """
+    for name in CATEGORICAL_FIELDS:
+        value = record.get(name)
+        if isinstance(value, str):
+            record[name] = intern(value)
+
+
+# Receipts in a batch repeat the same few dates and times, and the parsed
+# values are immutable, so parsing is memoized per raw string
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a raw date string, returning None if it is not a valid date."""
+    # Handle Korean format (YYYY년 MM월 DD일); a literal check skips the
+    # regex for the common numeric formats
+    if '년' in date_str:
+        korean_match = _KOREAN_DATE.search(date_str)
+        if korean_match:
+            year, month, day = korean_match.groups()
+            date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
+
+    # Clean the string - extract just the date part. Plain YYYY-MM-DD is at
+    # most 10 characters, so only longer strings can carry a suffix
+    if len(date_str) > 10:
+        date_str = _DATE_TAIL.sub('', date_str)  # Remove trailing timestamp like -00004
+
+    # Build the datetime directly instead of trying strptime formats
+    match = _DATE_RE.fullmatch(date_str.strip())
+    if match:
+        try:
+            return datetime(int(match[1]), int(match[3]), int(match[4]))
+        except ValueError:
+            pass  # Out-of-range month/day, e.g. 2026-02-30
+
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(time_str: str) -> Optional[str]:
+    """Parse a raw time string to HH:MM:SS or HH:MM, or None."""
+    # Handle Korean format (HH시 MM분); as for dates, a literal check skips
+    # the regex for the common HH:MM[:SS] formats
+    if '시' in time_str:
+        korean_match = _KOREAN_TIME.search(time_str)
+        if korean_match:
+            hour, minute = korean_match.groups()
+            return f"{hour.zfill(2)}:{minute.zfill(2)}"
+
+    # Handle standard formats
+    match = _TIME_PAT.search(time_str)
+    if match:
+        hour, minute, second = match.groups()
+        if second:
+            return f"{hour.zfill(2)}:{minute}:{second}"
+        else:
+            return f"{hour.zfill(2)}:{minute}"
+
+    return None
+
 
 class DataNormalizer:
     """
     Normalizes extracted raw data into standardized formats.
 
     Handles:
-    - Numeric normalization (removing commas, spaces, converting to Decimal)
+    - Numeric normalization (removing commas, spaces, converting to int)
     - Date/time normalization
     - String cleaning and standardization
     """
 
-    def __init__(self):
-        """Initialize the data normalizer."""
-        self.logger = logging.getLogger(self.__class__.__name__)
+    logger = logging.getLogger(__qualname__)
 
     def normalize(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -39,63 +125,65 @@ class DataNormalizer:
         """
         self.logger.debug("Starting data normalization")
 
+        # Categorical fields repeat across receipts, so they are interned and
+        # records built in this process share one object per distinct value
+        # (pooled batches re-intern with intern_categorical())
         normalized = {
             'gross_weight_kg': self.normalize_weight(extracted_data.get('gross_weight')),
             'tare_weight_kg': self.normalize_weight(extracted_data.get('tare_weight')),
             'net_weight_kg': self.normalize_weight(extracted_data.get('net_weight')),
-            'vehicle_number': self.normalize_vehicle_number(extracted_data.get('vehicle_number')),
+            'vehicle_number': _intern(self.normalize_vehicle_number(extracted_data.get('vehicle_number'))),
             'measurement_date': self.normalize_date(extracted_data.get('date')),
             'measurement_time': self.normalize_time(extracted_data.get('time')),
-            'customer_name': self.normalize_string(extracted_data.get('customer_name')),
-            'product_name': self.normalize_string(extracted_data.get('product_name')),
-            'transaction_type': self.normalize_string(extracted_data.get('transaction_type')),
+            'customer_name': _intern(self.normalize_string(extracted_data.get('customer_name'))),
+            'product_name': _intern(self.normalize_string(extracted_data.get('product_name'))),
+            'transaction_type': _intern(self.normalize_string(extracted_data.get('transaction_type'))),
             'measurement_id': self.normalize_string(extracted_data.get('measurement_id')),
-            'location': self.normalize_string(extracted_data.get('location')),
+            'location': _intern(self.normalize_string(extracted_data.get('location'))),
             'raw_text': extracted_data.get('raw_text', ''),
         }
 
-        # Log normalization results
-        non_null_count = sum(1 for v in normalized.values() if v is not None)
-        self.logger.info(f"Normalized {non_null_count} non-null fields")
+        # Log normalization results (only count fields if it will be logged)
+        if self.logger.isEnabledFor(logging.INFO):
+            non_null_count = sum(1 for v in normalized.values() if v is not None)
+            self.logger.info("Normalized %d non-null fields", non_null_count)
 
         return normalized
 
-    def normalize_weight(self, weight_str: Optional[str]) -> Optional[Decimal]:
+    def normalize_weight(self, weight_str: Optional[str]) -> Optional[int]:
         """
-        Normalize weight string to Decimal.
+        Normalize weight string to whole kilograms.
 
         Handles:
         - Comma removal (12,480 -> 12480)
         - Space removal (13 460 -> 13460)
-        - Conversion to Decimal for precision
+        - Conversion to int (receipts only print whole kilograms)
 
         Args:
             weight_str: Raw weight string
 
         Returns:
-            Normalized weight as Decimal, or None if invalid
+            Normalized weight in kg as int, or None if invalid
         """
         if not weight_str:
             return None
 
-        try:
-            # Remove commas and spaces
-            cleaned = re.sub(r'[,\s]', '', weight_str)
-
-            # Convert to Decimal for precision
-            weight = Decimal(cleaned)
-
-            if weight < 0:
-                self.logger.warning(f"Negative weight detected: {weight}")
-                return None
+        # Remove commas and whitespace with plain str methods
+        cleaned = ''.join(weight_str.replace(',', '').split())
 
-            self.logger.debug(f"Normalized weight: {weight_str} -> {weight}")
-            return weight
-
-        except (InvalidOperation, ValueError) as e:
-            self.logger.error(f"Failed to normalize weight '{weight_str}': {e}")
+        # A digit check is far cheaper than letting int() raise on bad input
+        if not cleaned.isdecimal():
+            if cleaned[:1] == '-' and cleaned[1:].isdecimal():
+                self.logger.warning("Negative weight detected: %s", cleaned)
+            else:
+                self.logger.error("Failed to normalize weight '%s': not a number", weight_str)
             return None
 
+        # Convert to int; integer arithmetic is exact and cheap
+        weight = int(cleaned)
+        self.logger.debug("Normalized weight: %s -> %s", weight_str, weight)
+        return weight
+
     def normalize_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """
         Normalize date string to datetime object.
@@ -115,35 +203,12 @@ class DataNormalizer:
         if not date_str:
             return None
 
-        # List of date format patterns to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%Y.%m.%d',
-            '%Y-%m-%d-%H%M%S',  # With timestamp suffix
-        ]
-
-        # Handle Korean format (YYYY년 MM월 DD일)
-        korean_date_pattern = r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'
-        korean_match = re.search(korean_date_pattern, date_str)
-        if korean_match:
-            year, month, day = korean_match.groups()
-            date_str = f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-
-        # Clean the string - extract just the date part
-        date_str = re.sub(r'-\d{5,6}$', '', date_str)  # Remove trailing timestamp like -00004
-
-        # Try each format
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                self.logger.debug(f"Normalized date: {date_str} -> {dt}")
-                return dt
-            except ValueError:
-                continue
-
-        self.logger.warning(f"Could not parse date: {date_str}")
-        return None
+        dt = _parse_date(date_str)
+        if dt is None:
+            self.logger.warning("Could not parse date: %s", date_str)
+        else:
+            self.logger.debug("Normalized date: %s -> %s", date_str, dt)
+        return dt
 
     def normalize_time(self, time_str: Optional[str]) -> Optional[str]:
         """
@@ -163,25 +228,10 @@ class DataNormalizer:
         if not time_str:
             return None
 
-        # Handle Korean format (HH시 MM분)
-        korean_time_pattern = r'(\d{1,2})시\s*(\d{1,2})분'
-        korean_match = re.search(korean_time_pattern, time_str)
-        if korean_match:
-            hour, minute = korean_match.groups()
-            return f"{hour.zfill(2)}:{minute.zfill(2)}"
-
-        # Handle standard formats
-        time_pattern = r'(\d{1,2}):(\d{2})(?::(\d{2}))?'
-        match = re.search(time_pattern, time_str)
-        if match:
-            hour, minute, second = match.groups()
-            if second:
-                return f"{hour.zfill(2)}:{minute}:{second}"
-            else:
-                return f"{hour.zfill(2)}:{minute}"
-
-        self.logger.warning(f"Could not parse time: {time_str}")
-        return None
+        normalized = _parse_time(time_str)
+        if normalized is None:
+            self.logger.warning("Could not parse time: %s", time_str)
+        return normalized
 
     def normalize_vehicle_number(self, vehicle_str: Optional[str]) -> Optional[str]:
         """
@@ -198,10 +248,10 @@ class DataNormalizer:
         if not vehicle_str:
             return None
 
-        # Remove extra whitespace
-        normalized = re.sub(r'\s+', '', vehicle_str.strip())
+        # Remove all whitespace
+        normalized = ''.join(vehicle_str.split())
 
-        self.logger.debug(f"Normalized vehicle number: {vehicle_str} -> {normalized}")
+        self.logger.debug("Normalized vehicle number: %s -> %s", vehicle_str, normalized)
         return normalized
 
     def normalize_string(self, value: Optional[str]) -> Optional[str]:
@@ -220,15 +270,15 @@ class DataNormalizer:
             return None
 
         # Remove extra whitespace but preserve single spaces
-        normalized = re.sub(r'\s+', ' ', value.strip())
+        normalized = ' '.join(value.split())
 
         return normalized if normalized else None
 
     def calculate_net_weight(
         self,
-        gross_weight: Optional[Decimal],
-        tare_weight: Optional[Decimal]
-    ) -> Optional[Decimal]:
+        gross_weight: Optional[int],
+        tare_weight: Optional[int]
+    ) -> Optional[int]:
         """
         Calculate net weight from gross and tare weights.
 
@@ -244,8 +294,10 @@ class DataNormalizer:
 
         try:
             net = gross_weight - tare_weight
-            self.logger.debug(f"Calculated net weight: {gross_weight} - {tare_weight} = {net}")
+            self.logger.debug(
+                "Calculated net weight: %s - %s = %s", gross_weight, tare_weight, net
+            )
             return net
         except Exception as e:
-            self.logger.error(f"Failed to calculate net weight: {e}")
+            self.logger.error("Failed to calculate net weight: %s", e)
             return None
@@ -14,6 +14,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of going through the re cache
+# Standalone symbol: starting with the class (the lookbehind checks the
+# character before it) lets sre jump straight to candidate symbols
+_STRAY_SYMBOL = re.compile(r'[·*\-~](?<!\S.)(?!\S)')
+
+# Spaced-out Korean label variations and their canonical form
+_LABEL_PATTERNS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in {
+        r'차\s*량\s*번\s*호': '차량번호',
+        r'차\s*번\s*호': '차량번호',
+        r'총\s*중\s*량': '총중량',
+        r'차\s*중\s*량': '차중량',
+        r'공\s*차\s*중\s*량': '공차중량',
+        r'실\s*중\s*량': '실중량',
+        r'계\s*량\s*일\s*자': '계량일자',
+        r'거\s*래\s*처': '거래처',
+        r'상\s*호': '상호',
+        r'품\s*명': '품명',
+        r'제\s*품\s*명': '제품명',
+    }.items()
+]
+
 
 class TextCleaner:
     """
@@ -23,9 +46,7 @@ class TextCleaner:
     from OCR systems, preparing it for pattern-based field extraction.
     """
 
-    def __init__(self):
-        """Initialize the text cleaner."""
-        self.logger = logging.getLogger(self.__class__.__name__)
+    logger = logging.getLogger(__qualname__)
 
     def clean(self, ocr_data: Dict[str, Any]) -> str:
         """
@@ -47,13 +68,18 @@ class TextCleaner:
             # Apply cleaning pipeline
             cleaned_text = self._normalize_unicode(raw_text)
             cleaned_text = self._normalize_whitespace(cleaned_text)
-            cleaned_text = self._remove_noise(cleaned_text)
 
-            self.logger.debug(f"Cleaned text length: {len(cleaned_text)}")
+            # Whitespace normalization leaves no empty lines, so the noise
+            # pass only needs to re-filter lines if it removed a symbol
+            cleaned_text, removed = _STRAY_SYMBOL.subn('', cleaned_text)
+            if removed:
+                cleaned_text = self._drop_empty_lines(cleaned_text)
+
+            self.logger.debug("Cleaned text length: %d", len(cleaned_text))
             return cleaned_text
 
         except Exception as e:
-            self.logger.error(f"Error during text cleaning: {e}")
+            self.logger.error("Error during text cleaning: %s", e)
             raise ValueError(f"Failed to clean OCR data: {e}")
 
     def _extract_text_from_ocr(self, ocr_data: Dict[str, Any]) -> str:
@@ -66,27 +92,28 @@ class TextCleaner:
         Returns:
             Extracted text string
         """
+        # Plain text needs no structure dispatch
+        if isinstance(ocr_data, str):
+            return ocr_data
+
         # Handle different OCR response structures
         if isinstance(ocr_data, dict):
             # Try to extract from common OCR API formats
-            if 'pages' in ocr_data and isinstance(ocr_data['pages'], list):
-                if ocr_data['pages'] and 'text' in ocr_data['pages'][0]:
-                    return ocr_data['pages'][0]['text']
+            pages = ocr_data.get('pages')
+            page = pages[0] if isinstance(pages, list) and pages else None
+            if page is not None and 'text' in page:
+                return page['text']
 
             if 'text' in ocr_data:
                 return ocr_data['text']
 
             # If we have the full structure, try to reconstruct from words/lines
-            if 'pages' in ocr_data and isinstance(ocr_data['pages'], list):
-                page = ocr_data['pages'][0]
+            if page is not None:
                 if 'lines' in page:
                     return '\n'.join(line.get('text', '') for line in page['lines'])
                 elif 'words' in page:
                     return ' '.join(word.get('text', '') for word in page['words'])
 
-        elif isinstance(ocr_data, str):
-            return ocr_data
-
         raise ValueError("Invalid OCR data structure")
 
     def _normalize_unicode(self, text: str) -> str:
@@ -99,6 +126,10 @@ class TextCleaner:
         Returns:
             Unicode-normalized text
         """
+        # NFKC leaves pure ASCII unchanged, so skip the call entirely
+        if text.isascii():
+            return text
+
         # Use NFKC normalization to standardize Korean characters and symbols
         return unicodedata.normalize('NFKC', text)
 
@@ -112,17 +143,18 @@ class TextCleaner:
         Returns:
             Text with normalized whitespace
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r'[ \t]+', ' ', text)
+        # Plain str methods run in C without going through the regex engine
+        text = text.replace('\t', ' ')
 
-        # Preserve line breaks but remove excessive ones
-        text = re.sub(r'\n\s*\n+', '\n', text)
+        # Remove leading/trailing whitespace from each line and drop the
+        # lines left empty, preserving single line breaks
+        text = '\n'.join([line for line in map(str.strip, text.split('\n')) if line])
 
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
+        # Replace multiple spaces with single space
+        while '  ' in text:
+            text = text.replace('  ', ' ')
 
-        return text.strip()
+        return text
 
     def _remove_noise(self, text: str) -> str:
         """
@@ -139,18 +171,23 @@ class TextCleaner:
         # This pattern preserves most useful characters while removing noise
 
         # Remove standalone special symbols that are likely OCR errors
-        text = re.sub(r'(?<!\S)[·\*\-~]{1}(?!\S)', '', text)
+        text = _STRAY_SYMBOL.sub('', text)
 
+        return self._drop_empty_lines(text)
+
+    def _drop_empty_lines(self, text: str) -> str:
+        """
+        Remove lines without substantial content.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text without empty or whitespace-only lines
+        """
         # Remove very short isolated fragments (likely OCR errors)
         # but preserve Korean single characters as they might be valid
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            # Keep lines that have substantial content
-            if len(line.strip()) > 0:
-                cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
+        return '\n'.join([line for line in text.split('\n') if line.strip()])
 
     def normalize_korean_labels(self, text: str) -> str:
         """
@@ -164,22 +201,7 @@ class TextCleaner:
         Returns:
             Text with normalized Korean labels
         """
-        # Normalize spacing in common labels
-        label_variations = {
-            r'차\s*량\s*번\s*호': '차량번호',
-            r'차\s*번\s*호': '차량번호',
-            r'총\s*중\s*량': '총중량',
-            r'차\s*중\s*량': '차중량',
-            r'공\s*차\s*중\s*량': '공차중량',
-            r'실\s*중\s*량': '실중량',
-            r'계\s*량\s*일\s*자': '계량일자',
-            r'거\s*래\s*처': '거래처',
-            r'상\s*호': '상호',
-            r'품\s*명': '품명',
-            r'제\s*품\s*명': '제품명',
-        }
-
-        for pattern, replacement in label_variations.items():
-            text = re.sub(pattern, replacement, text)
+        for pattern, replacement in _LABEL_PATTERNS:
+            text = pattern.sub(replacement, text)
 
         return text
@@ -2,29 +2,44 @@
 
 This module handles file I/O operations including:
 - Reading OCR JSON files
-- Writing output to JSON and CSV
+- Writing output to JSON, NDJSON and CSV
 - Batch processing
+
+JSON is read and written with the optional ``orjson`` package when it is
+installed, falling back to the standard library ``json`` module.
 """
 
 import json
 import csv
 import logging
+import os
+from fnmatch import fnmatch
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from decimal import Decimal
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # Optional dependency: pip install orjson
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize datetime values the JSON encoders don't handle."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class IOHandler:
     """
     Handles all file I/O operations for the parser.
     """
 
-    def __init__(self):
-        """Initialize IO handler."""
-        self.logger = logging.getLogger(self.__class__.__name__)
+    logger = logging.getLogger(__qualname__)
 
     def read_ocr_json(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -40,62 +55,141 @@ class IOHandler:
             FileNotFoundError: If file doesn't exist
             ValueError: If JSON is invalid
         """
-        if not file_path.exists():
+        # Read first instead of checking exists(): one syscall fewer per file
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.logger.info(f"Loaded OCR data from {file_path}")
+            # Both parsers take the raw UTF-8 bytes, skipping a decode pass
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.logger.info("Loaded OCR data from %s", file_path)
             return data
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # Also raised by orjson
             raise ValueError(f"Invalid JSON in {file_path}: {e}")
 
     def write_json(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: Path,
-        indent: int = 2
+        indent: Optional[int] = 2
     ):
         """
         Write data to JSON file.
 
+        Records are serialized and written one at a time, so a generator
+        of results is streamed to disk without holding the whole list.
+        They go to a temporary file next to output_path, which replaces
+        output_path only once the array is complete; if writing fails,
+        an existing output_path is left untouched.
+
+        The output parses to the same data json.dump would write. With
+        the standard library encoder it is byte-identical; orjson may
+        spell some numbers differently (e.g. 1e20 for 1e+20).
+
         Args:
-            data: List of dictionaries to write
+            data: Iterable of dictionaries to write
             output_path: Output file path
-            indent: JSON indentation (default: 2)
+            indent: JSON indentation (default: 2, None for compact output)
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Custom JSON encoder for Decimal and datetime
-        class CustomEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, Decimal):
-                    return float(obj)
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return super().default(obj)
+        # Each record is nested one level inside the array; compact output
+        # stays on one line with json.dump's ', ' item separator
+        if indent is None:
+            comma, separator, closing = b', ', b'', b']'
+        else:
+            comma, separator, closing = b',', b'\n' + b' ' * indent, b'\n]'
+        count = 0
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b'[')
+                for record in data:
+                    if count:
+                        f.write(comma)
+                    dumped = self._dump_record(record, indent)
+                    if separator:
+                        f.write(separator)
+                        dumped = dumped.replace(b'\n', separator)
+                    f.write(dumped)
+                    count += 1
+                f.write(closing if count else b']')
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self.logger.info("Wrote %d records to %s", count, output_path)
+
+    def _dump_record(self, record: Dict[str, Any], indent: Optional[int]) -> bytes:
+        """Serialize one record to UTF-8 JSON."""
+        if orjson is not None and indent == 2:
+            # orjson serializes straight to UTF-8 bytes (only 2-space indent);
+            # non-str keys are stringified like json.dumps does
+            return orjson.dumps(
+                record,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(
+            record, ensure_ascii=False, indent=indent, default=_json_default
+        ).encode('utf-8')
+
+    def write_ndjson(
+        self,
+        data: Iterable[Dict[str, Any]],
+        output_path: Path
+    ):
+        """
+        Write data as newline-delimited JSON (one compact record per line).
+
+        Args:
+            data: Iterable of dictionaries to write
+            output_path: Output file path
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent, cls=CustomEncoder)
+        count = 0
+        with open(output_path, 'wb') as f:
+            for record in data:
+                if orjson is not None:
+                    f.write(orjson.dumps(
+                        record, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    f.write(json.dumps(
+                        record, ensure_ascii=False, default=_json_default
+                    ).encode('utf-8'))
+                f.write(b'\n')
+                count += 1
 
-        self.logger.info(f"Wrote {len(data)} records to {output_path}")
+        self.logger.info("Wrote %d records to %s", count, output_path)
 
     def write_csv(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: Path,
         fieldnames: Optional[List[str]] = None
     ):
         """
         Write data to CSV file.
 
+        Rows are converted and written one at a time, so a generator of
+        records is streamed to disk without an intermediate list.
+
         Args:
-            data: List of dictionaries to write
+            data: Iterable of dictionaries to write
             output_path: Output file path
             fieldnames: List of field names (if None, inferred from first record)
+
+        Raises:
+            ValueError: If a record has fields missing from fieldnames
         """
-        if not data:
+        records = iter(data)
+        first = next(records, None)
+        if first is None:
             self.logger.warning("No data to write to CSV")
             return
 
@@ -103,38 +197,49 @@ class IOHandler:
 
         # Infer fieldnames if not provided
         if fieldnames is None:
-            fieldnames = list(data[0].keys())
+            fieldnames = list(first.keys())
 
         # Convert values for CSV compatibility
         def convert_value(val):
-            if isinstance(val, (Decimal, float)):
-                return float(val)
-            if isinstance(val, datetime):
-                return val.isoformat()
             if val is None:
                 return ''
-            return str(val)
+            if isinstance(val, datetime):
+                return val.isoformat()
+            return val
 
-        # Prepare data for CSV
-        csv_data = []
-        for record in data:
-            csv_record = {k: convert_value(v) for k, v in record.items()}
-            csv_data.append(csv_record)
+        # Like csv.DictWriter, refuse rows that would silently lose fields
+        known = set(fieldnames)
 
+        count = 0
         with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(csv_data)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            for record in chain((first,), records):
+                unknown = record.keys() - known
+                if unknown:
+                    raise ValueError(
+                        f"Record has fields not in fieldnames: {', '.join(sorted(unknown))}"
+                    )
+                get = record.get
+                writer.writerow([convert_value(get(k)) for k in fieldnames])
+                count += 1
 
-        self.logger.info(f"Wrote {len(data)} records to {output_path}")
+        self.logger.info("Wrote %d records to %s", count, output_path)
 
-    def read_batch(self, input_dir: Path, pattern: str = "*.json") -> List[Path]:
+    def read_batch(
+        self,
+        input_dir: Path,
+        pattern: str = "*.json",
+        sort: bool = True
+    ) -> List[Path]:
         """
         Find all files matching pattern in directory.
 
         Args:
             input_dir: Input directory path
             pattern: File pattern (default: *.json)
+            sort: Return files sorted by path (default: True); pass False
+                when processing order doesn't matter to skip the sort
 
         Returns:
             List of file paths
@@ -142,10 +247,18 @@ class IOHandler:
         if not input_dir.exists():
             raise FileNotFoundError(f"Directory not found: {input_dir}")
 
-        files = list(input_dir.glob(pattern))
-        self.logger.info(f"Found {len(files)} files matching '{pattern}' in {input_dir}")
+        if '/' in pattern or os.sep in pattern:
+            # Recursive or nested patterns need pathlib's glob
+            files = list(input_dir.glob(pattern))
+        else:
+            # A single scandir pass, matching names without a stat per entry
+            with os.scandir(input_dir) as entries:
+                files = [Path(entry.path) for entry in entries if fnmatch(entry.name, pattern)]
+        self.logger.info("Found %d files matching '%s' in %s", len(files), pattern, input_dir)
 
-        return sorted(files)
+        if sort:
+            files.sort()
+        return files
 
     def save_processing_report(
         self,
@@ -160,4 +273,4 @@ class IOHandler:
             output_path: Output file path
         """
         self.write_json([report], output_path, indent=2)
-        self.logger.info(f"Saved processing report to {output_path}")
+        self.logger.info("Saved processing report to %s", output_path)
@@ -5,14 +5,66 @@ completeness, and business rule compliance.
 """
 
 import logging
-from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from ..config import Config
 from ..models.schema import ValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Weight check flags returned by _check_weights()
+_W_GROSS_NOT_ABOVE_TARE = 1 << 0
+_W_NET_MISMATCH = 1 << 1
+_W_GROSS_ABOVE_MAX = 1 << 2
+_W_GROSS_BELOW_MIN = 1 << 3
+_W_TARE_ABOVE_MAX = 1 << 4
+_W_TARE_BELOW_MIN = 1 << 5
+_W_NET_ABOVE_MAX = 1 << 6
+_W_NET_BELOW_MIN = 1 << 7
+
+
+def _check_weights(
+    gross: int,
+    tare: int,
+    net: int,
+    tolerance: int,
+    max_weight: int,
+    min_weight: int
+) -> int:
+    """
+    Run all weight checks with plain int comparisons.
+
+    Args:
+        gross: Gross weight in kg
+        tare: Tare weight in kg
+        net: Recorded net weight in kg
+        tolerance: Allowed net weight discrepancy in kg
+        max_weight: Largest reasonable weight in kg
+        min_weight: Smallest reasonable weight in kg
+
+    Returns:
+        Bitmask of _W_* flags, 0 if every check passed
+    """
+    flags = 0
+    if gross <= tare:
+        flags |= _W_GROSS_NOT_ABOVE_TARE
+    if abs(gross - tare - net) > tolerance:
+        flags |= _W_NET_MISMATCH
+    if gross > max_weight:
+        flags |= _W_GROSS_ABOVE_MAX
+    if gross < min_weight:
+        flags |= _W_GROSS_BELOW_MIN
+    if tare > max_weight:
+        flags |= _W_TARE_ABOVE_MAX
+    if tare < min_weight:
+        flags |= _W_TARE_BELOW_MIN
+    if net > max_weight:
+        flags |= _W_NET_ABOVE_MAX
+    if net < min_weight:
+        flags |= _W_NET_BELOW_MIN
+    return flags
+
 
 class DataValidator:
     """
@@ -25,7 +77,21 @@ class DataValidator:
     - Business rule validation
     """
 
-    def __init__(self, tolerance_kg: Decimal = Decimal('1.0')):
+    logger = logging.getLogger(__qualname__)
+
+    # Per-record constants, built once instead of on every validate() call
+    _CRITICAL_FIELDS = ('gross_weight_kg', 'tare_weight_kg', 'net_weight_kg')
+    _IMPORTANT_FIELDS = ('vehicle_number', 'measurement_date')
+    _COMPLETENESS_FIELDS = (
+        'gross_weight_kg', 'tare_weight_kg', 'net_weight_kg',
+        'vehicle_number', 'measurement_date', 'customer_name',
+        'product_name', 'transaction_type', 'measurement_id', 'location'
+    )
+    _MAX_REASONABLE = Config.MAX_REASONABLE_WEIGHT_KG  # 100 tons
+    _MIN_REASONABLE = Config.MIN_REASONABLE_WEIGHT_KG  # 1 kg
+    _MAX_AGE_DAYS = 10 * 365.25  # 10 years
+
+    def __init__(self, tolerance_kg: int = 1):
         """
         Initialize the validator.
 
@@ -33,14 +99,19 @@ class DataValidator:
             tolerance_kg: Allowed tolerance for weight calculations (in kg)
         """
         self.tolerance_kg = tolerance_kg
-        self.logger = logging.getLogger(self.__class__.__name__)
 
-    def validate(self, data: Dict[str, Any]) -> ValidationResult:
+    def validate(
+        self,
+        data: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> ValidationResult:
         """
         Validate normalized data.
 
         Args:
             data: Dictionary of normalized data
+            now: Reference time for the date checks (default: current
+                time); batch callers pass one shared timestamp
 
         Returns:
             ValidationResult with validation status and messages
@@ -54,16 +125,14 @@ class DataValidator:
         computed_net = None
 
         # Check for critical required fields
-        critical_fields = ['gross_weight_kg', 'tare_weight_kg', 'net_weight_kg']
-        missing_critical = [f for f in critical_fields if data.get(f) is None]
+        missing_critical = [f for f in self._CRITICAL_FIELDS if data.get(f) is None]
 
         if missing_critical:
             errors.append(f"Missing critical fields: {', '.join(missing_critical)}")
             is_valid = False
 
         # Check for important but non-critical fields
-        important_fields = ['vehicle_number', 'measurement_date']
-        missing_important = [f for f in important_fields if data.get(f) is None]
+        missing_important = [f for f in self._IMPORTANT_FIELDS if data.get(f) is None]
 
         if missing_important:
             warnings.append(f"Missing important fields: {', '.join(missing_important)}")
@@ -77,54 +146,63 @@ class DataValidator:
             # Calculate expected net weight
             computed_net = gross - tare
 
-            # Check if gross > tare (basic sanity)
-            if gross <= tare:
-                errors.append(
-                    f"Gross weight ({gross} kg) must be greater than tare weight ({tare} kg)"
-                )
-                is_valid = False
-                weight_consistency = False
-
-            # Check if net weight matches calculation (within tolerance)
-            weight_diff = abs(computed_net - net)
-            if weight_diff > self.tolerance_kg:
-                warnings.append(
-                    f"Net weight discrepancy: recorded={net} kg, "
-                    f"calculated={computed_net} kg, difference={weight_diff} kg"
-                )
-                weight_consistency = False
-
-            # Check for reasonable weight ranges
-            max_reasonable_weight = Decimal('100000')  # 100 tons
-            min_reasonable_weight = Decimal('1')  # 1 kg
-
-            for weight_name, weight_value in [
-                ('gross', gross), ('tare', tare), ('net', net)
-            ]:
-                if weight_value > max_reasonable_weight:
-                    warnings.append(
-                        f"{weight_name.capitalize()} weight ({weight_value} kg) "
-                        f"exceeds reasonable maximum"
+            # Check if gross > tare, net matches the calculation (within
+            # tolerance) and all weights lie in a reasonable range
+            flags = _check_weights(
+                gross, tare, net, self.tolerance_kg,
+                self._MAX_REASONABLE, self._MIN_REASONABLE
+            )
+
+            # Messages are only built for records that failed a check
+            if flags:
+                if flags & _W_GROSS_NOT_ABOVE_TARE:
+                    errors.append(
+                        f"Gross weight ({gross} kg) must be greater than tare weight ({tare} kg)"
                     )
-                if weight_value < min_reasonable_weight:
+                    is_valid = False
+                    weight_consistency = False
+
+                if flags & _W_NET_MISMATCH:
+                    weight_diff = abs(computed_net - net)
                     warnings.append(
-                        f"{weight_name.capitalize()} weight ({weight_value} kg) "
-                        f"below reasonable minimum"
+                        f"Net weight discrepancy: recorded={net} kg, "
+                        f"calculated={computed_net} kg, difference={weight_diff} kg"
                     )
+                    weight_consistency = False
+
+                for weight_name, weight_value, above_max, below_min in [
+                    ('gross', gross, _W_GROSS_ABOVE_MAX, _W_GROSS_BELOW_MIN),
+                    ('tare', tare, _W_TARE_ABOVE_MAX, _W_TARE_BELOW_MIN),
+                    ('net', net, _W_NET_ABOVE_MAX, _W_NET_BELOW_MIN),
+                ]:
+                    if flags & above_max:
+                        warnings.append(
+                            f"{weight_name.capitalize()} weight ({weight_value} kg) "
+                            f"exceeds reasonable maximum"
+                        )
+                    if flags & below_min:
+                        warnings.append(
+                            f"{weight_name.capitalize()} weight ({weight_value} kg) "
+                            f"below reasonable minimum"
+                        )
 
         # Validate date if present
         if data.get('measurement_date'):
             date = data['measurement_date']
             if isinstance(date, datetime):
+                if now is None:
+                    now = datetime.now()
+
                 # Check if date is not in the future
-                if date > datetime.now():
+                if date > now:
                     warnings.append(
                         f"Measurement date ({date.strftime('%Y-%m-%d')}) is in the future"
                     )
 
                 # Check if date is not too old (e.g., more than 10 years)
-                years_old = (datetime.now() - date).days / 365.25
-                if years_old > 10:
+                age_days = (now - date).days
+                if age_days > self._MAX_AGE_DAYS:
+                    years_old = age_days / 365.25
                     warnings.append(
                         f"Measurement date ({date.strftime('%Y-%m-%d')}) "
                         f"is unusually old ({int(years_old)} years)"
@@ -149,15 +227,15 @@ class DataValidator:
 
         # Log validation summary
         self.logger.info(
-            f"Validation complete: valid={is_valid}, "
-            f"warnings={len(warnings)}, errors={len(errors)}"
+            "Validation complete: valid=%s, warnings=%d, errors=%d",
+            is_valid, len(warnings), len(errors)
         )
 
         for warning in warnings:
-            self.logger.warning(f"Validation warning: {warning}")
+            self.logger.warning("Validation warning: %s", warning)
 
         for error in errors:
-            self.logger.error(f"Validation error: {error}")
+            self.logger.error("Validation error: %s", error)
 
         return result
 
@@ -171,15 +249,13 @@ class DataValidator:
         Returns:
             Completeness score (percentage of non-null fields)
         """
-        all_fields = [
-            'gross_weight_kg', 'tare_weight_kg', 'net_weight_kg',
-            'vehicle_number', 'measurement_date', 'customer_name',
-            'product_name', 'transaction_type', 'measurement_id', 'location'
-        ]
+        total = len(self._COMPLETENESS_FIELDS)
+        non_null_count = total - list(map(data.get, self._COMPLETENESS_FIELDS)).count(None)
+        completeness = non_null_count / total
 
-        non_null_count = sum(1 for field in all_fields if data.get(field) is not None)
-        completeness = non_null_count / len(all_fields)
-
-        self.logger.debug(f"Completeness score: {completeness:.2%} ({non_null_count}/{len(all_fields)})")
+        self.logger.debug(
+            "Completeness score: %.2f%% (%d/%d)",
+            completeness * 100, non_null_count, total
+        )
 
         return completeness
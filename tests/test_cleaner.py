@@ -7,7 +7,7 @@ from src.preprocessing.cleaner import TextCleaner
 class TestTextCleaner:
     """Test suite for TextCleaner class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def cleaner(self):
         """Fixture to provide TextCleaner instance."""
         return TextCleaner()
@@ -21,6 +21,13 @@ class TestTextCleaner:
         assert result.startswith("계량일자:")
         assert result.endswith("8713")
 
+    def test_normalize_whitespace_tabs_and_blank_lines(self, cleaner):
+        """Test that tab runs collapse and whitespace-only lines are dropped."""
+        text = "  총중량:\t\t 12,480 kg\n \t \n\n실중량:    5,010 kg\n "
+        result = cleaner._normalize_whitespace(text)
+
+        assert result == "총중량: 12,480 kg\n실중량: 5,010 kg"
+
     def test_normalize_unicode(self, cleaner):
         """Test Unicode normalization."""
         text = "계량증명서"  # Korean text
@@ -88,3 +95,9 @@ class TestTextCleaner:
         assert "계 량 일 자:" in result or "계량일자" in result
         assert "2026-02-02" in result
         assert "  " not in result  # No excessive whitespace
+
+    def test_clean_keeps_line_breaks_and_in_value_symbols(self, cleaner):
+        """Test that only standalone symbols go and line structure is kept."""
+        result = cleaner.clean("거래처: 동우·바이오\n· \n품명: 국판")
+
+        assert result == "거래처: 동우·바이오\n품명: 국판"
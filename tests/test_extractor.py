@@ -7,7 +7,7 @@ from src.extraction.extractor import FieldExtractor
 class TestFieldExtractor:
     """Test suite for FieldExtractor class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def extractor(self):
         """Fixture to provide FieldExtractor instance."""
         return FieldExtractor()
@@ -125,3 +125,123 @@ class TestFieldExtractor:
         assert result is not None
         assert "13" in result
         assert "460" in result
+
+    def test_extract_weight_prefers_labelled_pattern(self, extractor):
+        """Test that a labelled weight wins over an earlier fallback match."""
+        text = "총중량: 05:26:18 12,480 kg\n차중량: 7,470 kg"
+
+        result = extractor._extract_weight(text, 'tare')
+
+        assert result == "7,470"
+
+    def test_extract_skips_fields_without_anchors(self, monkeypatch):
+        """Test that fields whose anchor literals are absent are not searched."""
+        from src.extraction.patterns import FieldPattern, find_anchored_fields
+
+        text = "차량번호: 8713\n총중량: 12,480 KG"
+        present = find_anchored_fields(text)
+
+        assert 'weight_gross' in present
+        assert 'vehicle' in present
+        assert 'transaction_type' not in present
+
+        searched = []
+        search = FieldPattern.search
+
+        def spy(pattern, text):
+            searched.append(pattern.key)
+            return search(pattern, text)
+
+        monkeypatch.setattr(FieldPattern, 'search', spy)
+        result = FieldExtractor().extract("차량번호: 8713 " + ": " * 50 + "12")
+
+        assert result['gross_weight'] is None
+        assert result['vehicle_number'] == "8713"
+        assert 'vehicle' in searched
+        assert not {'weight_gross', 'weight_tare', 'weight_net', 'transaction_type'} & set(searched)
+
+    def test_extract_weight_noisy_text_without_match(self, extractor):
+        """Test that long label-to-number noise fails fast instead of backtracking."""
+        text = "총중량" + " :" * 2000 + " 12 abc kg"
+
+        assert extractor._extract_weight(text, 'gross') is None
+
+    def test_extract_weight_searches_after_label(self, extractor):
+        """Test that the weight following the label is preferred."""
+        text = "입차 05:10:00 7,470 kg\n총중량: 05:26:18 12,480 kg"
+
+        result = extractor._extract_weight(text, 'gross')
+
+        assert result == "12,480"
+
+    def test_extract_weight_label_with_seconds_timestamp(self, extractor):
+        """Test that labelled weight lines accept HH:MM:SS timestamps."""
+        assert extractor._extract_weight("총중량: 05:26:18 12,480 kg", 'gross') == "12,480"
+        assert extractor._extract_weight("차중량: 02:07:11 7 560 kg", 'tare') == "7560"
+
+    def test_extract_weight_labelled_match_beats_unlabelled_reading(self, extractor):
+        """Test that a labelled weight wins over an earlier unlabelled reading."""
+        text = (
+            "총중량 계량 확인서\n입차시각 05:10:00 7,470 kg\n"
+            + "비고: 특이사항 없음 " * 6
+            + "\n총중량: 12,480 kg"
+        )
+
+        result = extractor._extract_weight(text, 'gross')
+
+        assert result == "12,480"
+
+    def test_extract_cached_result_is_not_shared(self, extractor):
+        """Test that repeated extraction hits the cache but returns fresh dicts."""
+        text = "차량번호: 8713\n총중량: 12,480 kg"
+        extractor._extract_cached.cache_clear()
+
+        first = extractor.extract(text)
+        first['vehicle_number'] = None
+        second = extractor.extract(text)
+
+        assert second['vehicle_number'] == "8713"
+        assert extractor._extract_cached.cache_info().hits == 1
+
+    def test_extract_with_pattern_overrides(self):
+        """Test that per-vendor patterns replace only the overridden fields."""
+        patterns = {'vehicle': [r'TRUCK\s*#\s*(\d{4})']}
+        extractor = FieldExtractor(patterns)
+        text = "TRUCK # 8713\n총중량: 12,480 kg"
+
+        result = extractor.extract(text)
+
+        assert result['vehicle_number'] == "8713"
+        assert result['gross_weight'] == "12,480"
+        assert FieldExtractor(patterns).p.vehicle is extractor.p.vehicle
+        assert FieldExtractor().p.vehicle is not extractor.p.vehicle
+
+        with pytest.raises(ValueError):
+            FieldExtractor({'plate': [r'(\d{4})']})
+
+    def test_extract_rejects_malformed_pattern_overrides(self):
+        """Test that overrides must map fields to non-empty lists of strings."""
+        test_cases = [
+            {'vehicle': r'TRUCK\s*#\s*(\d{4})'},
+            {'vehicle': []},
+            {'vehicle': 5},
+            {'vehicle': [r'(\d{4})', None]},
+            [r'TRUCK\s*#\s*(\d{4})'],
+        ]
+
+        for patterns in test_cases:
+            with pytest.raises(ValueError):
+                FieldExtractor(patterns)
+
+    def test_extractor_pickles_with_its_patterns(self):
+        """Test that a pickled extractor keeps its overrides and drops its cache."""
+        import pickle
+
+        extractor = FieldExtractor({'vehicle': [r'TRUCK\s*#\s*(\d{4})']})
+        extractor.extract("TRUCK # 8713")
+
+        restored = pickle.loads(pickle.dumps(extractor))
+
+        assert restored.extract("TRUCK # 5405")['vehicle_number'] == "5405"
+        assert restored.p.vehicle is extractor.p.vehicle
+        assert restored._extract_cached.cache_info().currsize == 1
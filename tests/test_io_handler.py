@@ -0,0 +1,58 @@
+"""Tests for file I/O utilities."""
+
+import json
+
+import pytest
+from src.utils import io_handler
+from src.utils.io_handler import IOHandler
+
+
+class TestIOHandler:
+    """Test suite for IOHandler output writers."""
+
+    @pytest.fixture(scope="module")
+    def handler(self):
+        """Fixture to provide IOHandler instance."""
+        return IOHandler()
+
+    @pytest.fixture
+    def records(self):
+        """Fixture to provide records with nested and non-ASCII values."""
+        return [
+            {'file_name': 'a.json', 'data': {'customer_name': "동우바이오", 'gross_weight_kg': 12480}},
+            {'file_name': 'b.json', 'data': {'ratio': 1e20, 'warnings': []}},
+        ]
+
+    def test_write_json_parses_to_records(self, handler, records, tmp_path):
+        """Test that the streamed array decodes to the records written."""
+        output_path = tmp_path / "out.json"
+
+        handler.write_json(iter(records), output_path)
+
+        assert json.loads(output_path.read_text(encoding='utf-8')) == records
+
+    def test_write_json_matches_json_dump_with_stdlib(self, handler, records, tmp_path, monkeypatch):
+        """Test byte-identical output to json.dump without orjson."""
+        monkeypatch.setattr(io_handler, "orjson", None)
+        output_path = tmp_path / "out.json"
+
+        for indent in (2, None):
+            handler.write_json(records, output_path, indent=indent)
+
+            expected = json.dumps(records, ensure_ascii=False, indent=indent)
+            assert output_path.read_text(encoding='utf-8') == expected
+
+    def test_write_json_keeps_old_file_on_failure(self, handler, records, tmp_path):
+        """Test that a failed write leaves the previous output and no temp file."""
+        output_path = tmp_path / "out.json"
+        output_path.write_text("[]", encoding='utf-8')
+
+        def failing():
+            yield records[0]
+            raise RuntimeError("parse failed")
+
+        with pytest.raises(RuntimeError):
+            handler.write_json(failing(), output_path)
+
+        assert output_path.read_text(encoding='utf-8') == "[]"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
@@ -0,0 +1,89 @@
+"""Tests for the parsing pipeline coordinator."""
+
+import json
+
+import pytest
+from src.extraction.extractor import FieldExtractor
+from src.main import OCRParser
+
+
+class TestOCRParser:
+    """Test suite for OCRParser batch processing."""
+
+    @pytest.fixture
+    def input_paths(self, tmp_path):
+        """Fixture to provide two receipts in a vendor's label format."""
+        paths = []
+        for name, vehicle in [('a.json', '8713'), ('b.json', '5405')]:
+            path = tmp_path / name
+            path.write_text(json.dumps({
+                'text': f"TRUCK # {vehicle}\n총중량: 12,480 kg\n차중량: 7,470 kg\n실중량: 5,010 kg"
+            }), encoding='utf-8')
+            paths.append(path)
+        return paths
+
+    def test_parse_batch_workers_match_serial(self, input_paths):
+        """Test that pooled workers use the parser's own components."""
+        parser = OCRParser(log_level="ERROR")
+        parser.extractor = FieldExtractor({'vehicle': [r'TRUCK\s*#\s*(\d{4})']})
+
+        serial = parser.parse_batch(input_paths, workers=1)
+        pooled = parser.parse_batch(input_paths, workers=2)
+
+        assert [r['data']['vehicle_number'] for r in serial] == ['8713', '5405']
+        for serial_result, pooled_result in zip(serial, pooled):
+            assert pooled_result['data'] == serial_result['data']
+            assert pooled_result['validation'] == serial_result['validation']
+
+    def test_parse_batch_with_vendor_patterns(self, input_paths):
+        """Test that vendor patterns given to the parser reach pooled workers."""
+        parser = OCRParser(log_level="ERROR", patterns={'vehicle': [r'TRUCK\s*#\s*(\d{4})']})
+
+        results = parser.parse_batch(input_paths, workers=2)
+
+        assert [r['data']['vehicle_number'] for r in results] == ['8713', '5405']
+
+    def test_parse_batch_workers_share_categorical_values(self, tmp_path):
+        """Test that pooled results share one object per categorical value."""
+        paths = []
+        for name in ('a.json', 'b.json'):
+            path = tmp_path / name
+            path.write_text(json.dumps({
+                'text': "거래처: 동우바이오\n구분: 입고\n총중량: 12,480 kg"
+            }), encoding='utf-8')
+            paths.append(path)
+
+        first, second = OCRParser(log_level="ERROR").parse_batch(paths, workers=2)
+
+        assert first['data']['customer_name'] == "동우바이오"
+        assert first['data']['customer_name'] is second['data']['customer_name']
+        assert first['data']['transaction_type'] is second['data']['transaction_type']
+
+    def test_parse_batch_small_default_batch_stays_serial(self, input_paths, monkeypatch):
+        """Test that default-sized batches below the threshold skip the pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small batch")
+
+        monkeypatch.setattr("src.main.ProcessPoolExecutor", no_pool)
+        monkeypatch.setattr("src.main.os.cpu_count", lambda: 4)
+
+        results = OCRParser(log_level="ERROR").parse_batch(input_paths)
+
+        assert [r['file_name'] for r in results] == ['a.json', 'b.json']
+
+    def test_worker_parser_uses_given_components(self, monkeypatch):
+        """Test that worker parsers are built without default components."""
+        import src.main as main_module
+
+        def no_defaults(*args, **kwargs):
+            raise AssertionError("default extractor constructed in worker")
+
+        parser = OCRParser(log_level="ERROR")
+        components = {name: getattr(parser, name) for name in main_module._PIPELINE_COMPONENTS}
+        monkeypatch.setattr(main_module, "FieldExtractor", no_defaults)
+        monkeypatch.setattr(main_module, "_worker_parser", None)
+
+        main_module._init_worker("ERROR", components)
+
+        assert main_module._worker_parser.extractor is parser.extractor
+        assert main_module._worker_parser.log_level == "ERROR"
@@ -1,7 +1,6 @@
 """Tests for data normalization module."""
 
 import pytest
-from decimal import Decimal
 from datetime import datetime
 from src.normalization.normalizer import DataNormalizer
 
@@ -9,7 +8,7 @@ from src.normalization.normalizer import DataNormalizer
 class TestDataNormalizer:
     """Test suite for DataNormalizer class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def normalizer(self):
         """Fixture to provide DataNormalizer instance."""
         return DataNormalizer()
@@ -17,10 +16,10 @@ class TestDataNormalizer:
     def test_normalize_weight_with_comma(self, normalizer):
         """Test weight normalization with comma separator."""
         test_cases = [
-            ("12,480", Decimal("12480")),
-            ("7,470", Decimal("7470")),
-            ("5,010", Decimal("5010")),
-            ("1,320", Decimal("1320")),
+            ("12,480", 12480),
+            ("7,470", 7470),
+            ("5,010", 5010),
+            ("1,320", 1320),
         ]
 
         for input_str, expected in test_cases:
@@ -30,9 +29,9 @@ class TestDataNormalizer:
     def test_normalize_weight_with_spaces(self, normalizer):
         """Test weight normalization with space separators."""
         test_cases = [
-            ("13 460", Decimal("13460")),
-            ("7 560", Decimal("7560")),
-            ("5 900", Decimal("5900")),
+            ("13 460", 13460),
+            ("7 560", 7560),
+            ("5 900", 5900),
         ]
 
         for input_str, expected in test_cases:
@@ -42,8 +41,8 @@ class TestDataNormalizer:
     def test_normalize_weight_plain_number(self, normalizer):
         """Test weight normalization with plain numbers."""
         test_cases = [
-            ("12480", Decimal("12480")),
-            ("130", Decimal("130")),
+            ("12480", 12480),
+            ("130", 130),
         ]
 
         for input_str, expected in test_cases:
@@ -81,6 +80,13 @@ class TestDataNormalizer:
         assert result.month == 2
         assert result.day == 2
 
+    def test_normalize_date_invalid(self, normalizer):
+        """Test that impossible or malformed dates are rejected."""
+        invalid_inputs = ["2026-02-30", "2026-13-01", "2026-02/02", "2026-02-02 extra"]
+
+        for date_str in invalid_inputs:
+            assert normalizer.normalize_date(date_str) is None
+
     def test_normalize_time_formats(self, normalizer):
         """Test time normalization with various formats."""
         test_cases = [
@@ -94,6 +100,14 @@ class TestDataNormalizer:
             assert result is not None
             assert expected in result
 
+    def test_normalize_date_repeated_input(self, normalizer):
+        """Test that repeated dates return the same memoized value."""
+        first = normalizer.normalize_date("2026.01.15")
+        second = normalizer.normalize_date("2026.01.15")
+
+        assert first == datetime(2026, 1, 15)
+        assert second is first
+
     def test_normalize_vehicle_number(self, normalizer):
         """Test vehicle number normalization."""
         test_cases = [
@@ -108,9 +122,9 @@ class TestDataNormalizer:
 
     def test_calculate_net_weight(self, normalizer):
         """Test net weight calculation."""
-        gross = Decimal("12480")
-        tare = Decimal("7470")
-        expected_net = Decimal("5010")
+        gross = 12480
+        tare = 7470
+        expected_net = 5010
 
         result = normalizer.calculate_net_weight(gross, tare)
 
@@ -118,8 +132,8 @@ class TestDataNormalizer:
 
     def test_calculate_net_weight_missing_values(self, normalizer):
         """Test net weight calculation with missing values."""
-        assert normalizer.calculate_net_weight(None, Decimal("100")) is None
-        assert normalizer.calculate_net_weight(Decimal("100"), None) is None
+        assert normalizer.calculate_net_weight(None, 100) is None
+        assert normalizer.calculate_net_weight(100, None) is None
 
     def test_normalize_full_data(self, normalizer):
         """Test normalization of complete extracted data."""
@@ -136,10 +150,22 @@ class TestDataNormalizer:
 
         result = normalizer.normalize(extracted)
 
-        assert result['gross_weight_kg'] == Decimal("12480")
-        assert result['tare_weight_kg'] == Decimal("7470")
-        assert result['net_weight_kg'] == Decimal("5010")
+        assert result['gross_weight_kg'] == 12480
+        assert result['tare_weight_kg'] == 7470
+        assert result['net_weight_kg'] == 5010
         assert result['vehicle_number'] == "8713"
         assert isinstance(result['measurement_date'], datetime)
         assert result['measurement_time'] == "05:26:18"
         assert result['customer_name'] == "동우바이오"
+
+    def test_normalize_interns_categorical_fields(self, normalizer):
+        """Test that repeated categorical values share one string object."""
+        first = normalizer.normalize({'customer_name': ' '.join(['동우', '바이오']),
+                                      'transaction_type': '입고'})
+        second = normalizer.normalize({'customer_name': ' '.join(['동우', '바이오']),
+                                       'transaction_type': '입고'})
+
+        assert first['customer_name'] == "동우 바이오"
+        assert first['customer_name'] is second['customer_name']
+        assert first['transaction_type'] is second['transaction_type']
+        assert first['location'] is None